@@ -9,16 +9,32 @@ Optimized for efficiency, readability, and correct resource resolution.
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import os
+import re
+import shutil
 import sys
-from dataclasses import dataclass
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache, partial
+from itertools import islice
+from multiprocessing.util import Finalize
 from pathlib import Path
 
 try:
     from muxtools import (
         AudioFile,
         Chapters,
-        GlobSearch,
+        FontFile,
         Premux,
         Setup,
         SubFile,
@@ -31,6 +47,9 @@ except ImportError as e:
 
 __all__ = ["RunMode", "ShowConfig", "mux_episode", "main"]
 
+# Script location (root); resolved once per process
+_BASE = Path(__file__).resolve().parent
+
 
 class RunMode(Enum):
     NORMAL = "normal"
@@ -47,18 +66,24 @@ class ShowConfig:
     audio_dir: Path
     tmdb_id: int = 0
     titles: tuple[str, ...] = ()
+    # Pre-stringified dirs for the lookup hot paths
+    premux_dir_s: str = field(init=False, repr=False, compare=False)
+    sub_dir_s: str = field(init=False, repr=False, compare=False)
+    audio_dir_s: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "premux_dir_s", str(self.premux_dir))
+        object.__setattr__(self, "sub_dir_s", str(self.sub_dir))
+        object.__setattr__(self, "audio_dir_s", str(self.audio_dir))
 
     @classmethod
     def from_defaults(cls) -> ShowConfig:
         """Create configuration relative to the script location."""
-        # Resolution relative to script location (root)
-        base = Path(__file__).resolve().parent
-
         return cls(
             name="Non Non Biyori Vacation",
-            premux_dir=base / "premux",
-            sub_dir=base / "subtitle",
-            audio_dir=base / "audio",
+            premux_dir=_BASE / "premux",
+            sub_dir=_BASE / "subtitle",
+            audio_dir=_BASE / "audio",
             tmdb_id=494471,
             titles=("Liburan",),
         )
@@ -67,6 +92,14 @@ class ShowConfig:
 CONFIG = ShowConfig.from_defaults()
 
 
+# Standard episode match: " - 01 ", "E01)", or "S01E01"
+_VIDEO_EP_RE = re.compile(r" - (\d{2}) |E(\d{2})\)|S01E(\d{2})")
+# Leading episode number of a subtitle file name, e.g. "01 - Title.ass"
+_EP_RE = re.compile(r"^(\d{2})")
+# Episode argument token: "3" or "1-5"
+_EP_SPEC_RE = re.compile(r"(\d+)(?:-(\d+))?")
+
+
 @dataclass(slots=True)
 class MuxResult:
     episode: str | int
@@ -81,75 +114,258 @@ def _get_episode_str(episode: str | int) -> str:
     return str(episode)
 
 
+@dataclass(frozen=True, slots=True)
+class _DirEntry:
+    """Snapshot of an ``os.DirEntry``, safe to keep after the scan closes."""
+
+    name: str
+    path: str
+    is_file: bool
+    is_dir: bool
+
+
+class _DirCache:
+    """Per-process directory listings; each directory is read at most once."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[_DirEntry, ...]] = {}
+
+    def list(self, dir_str: str) -> tuple[_DirEntry, ...]:
+        """Return the entries of ``dir_str`` (empty if it cannot be read)."""
+        entries = self._entries.get(dir_str)
+        if entries is None:
+            try:
+                with os.scandir(dir_str) as it:
+                    # Symlinked files count as files (only they need a stat);
+                    # symlinked dirs are not descended into
+                    entries = tuple(
+                        _DirEntry(
+                            e.name,
+                            e.path,
+                            e.is_file(),
+                            e.is_dir(follow_symlinks=False),
+                        )
+                        for e in it
+                    )
+            except OSError:
+                entries = ()
+            self._entries[dir_str] = entries
+        return entries
+
+
+_DIR_CACHE = _DirCache()
+
+
+def _iter_files(root: str, suffix: str) -> Iterator[_DirEntry]:
+    """Lazily yield files under ``root`` whose name ends with ``suffix``.
+
+    Walks with an explicit stack over ``_DIR_CACHE`` listings, so no directory
+    is read twice and only symlinks need a ``stat`` call.
+    """
+    # Case-insensitive where the OS is (Windows), like the old pathlib glob
+    suffix = os.path.normcase(suffix)
+    stack = [root]
+    while stack:
+        for entry in _DIR_CACHE.list(stack.pop()):
+            if entry.is_dir:
+                stack.append(entry.path)
+            elif entry.is_file and os.path.normcase(entry.name).endswith(suffix):
+                yield entry
+
+
+@lru_cache(maxsize=None)
+def _list_dir(dir_str: str, suffix: str) -> tuple[tuple[str, str], ...]:
+    """Recursively list ``(name, path)`` of files ending with suffix, once per process."""
+    found = [(e.name, e.path) for e in _iter_files(dir_str, suffix)]
+    found.sort(key=lambda f: f[1])
+    return tuple(found)
+
+
+@lru_cache(maxsize=None)
+def _build_video_index(config: ShowConfig) -> dict[str, Path]:
+    """Map episode strings to their video file, scanning ``premux_dir`` once."""
+    index: dict[str, Path] = {}
+    for name, p in _list_dir(config.premux_dir_s, ".mkv"):
+        for m in _VIDEO_EP_RE.finditer(name):
+            index.setdefault(m.group(m.lastindex), Path(p))
+    return index
+
+
+@lru_cache(maxsize=None)
+def _ep_pattern(ep_str: str) -> re.Pattern[str]:
+    """Compile the standard episode match for an arbitrary episode string."""
+    ep = re.escape(ep_str)
+    return re.compile(rf" - {ep} |E{ep}\)|S01E{ep}")
+
+
 def _find_video(ep_str: str, config: ShowConfig) -> Path:
     """Find the video file for the given episode string."""
-    search = GlobSearch(
-        "*.mkv",
-        allow_multiple=True,
-        recursive=True,
-        dir=str(config.premux_dir),
-    )
+    index = _build_video_index(config)
+    if ep_str in index:
+        return index[ep_str]
+
+    # Non-numeric identifiers (e.g. "SP1") are not indexed; match them directly
+    pattern = _ep_pattern(ep_str)
+    for name, p in _list_dir(config.premux_dir_s, ".mkv"):
+        if pattern.search(name):
+            return Path(p)
+
+    # Fallback for movies (usually treated as ep 01)
+    if ep_str == "01" or ep_str.lower() == "movie":
+        movie = _find_movie(config)
+        if movie is not None:
+            return movie
+
+    raise FileNotFoundError(f"Video file not found for episode {ep_str}")
 
-    for p in search.paths:
-        name = Path(p).name
 
-        # Standard episode match: " - 01 ", "E01)", or "S01E01"
-        if f" - {ep_str} " in name or f"E{ep_str})" in name or f"S01E{ep_str}" in name:
+@lru_cache(maxsize=None)
+def _find_movie(config: ShowConfig) -> Path | None:
+    """Pick the movie video when no episode-numbered file matches."""
+    videos = _list_dir(config.premux_dir_s, ".mkv")
+
+    # If only one video file, assume it's the movie
+    if len(videos) == 1:
+        return Path(videos[0][1])
+
+    # Or if filename contains "Vacation" (specific to this show)
+    for name, p in videos:
+        if "Vacation" in name:
             return Path(p)
 
-    # Fallback for movies (usually treated as ep 01)
-    if (ep_str == "01" or ep_str.lower() == "movie") and search.paths:
-        # If only one video file, assume it's the movie
-        if len(search.paths) == 1:
-            return Path(search.paths[0])
+    return None
 
-        # Or if filename contains "Vacation" (specific to this show)
-        for p in search.paths:
-            if "Vacation" in Path(p).name:
-                return Path(p)
 
-    raise FileNotFoundError(f"Video file not found for episode {ep_str}")
+@lru_cache(maxsize=None)
+def _lookup_audio(audio_dir: str, search_str: str) -> Path | None:
+    """Resolve the audio file matching ``search_str``, memoized per search string."""
+    pattern = f"*Audio*{search_str}*.flac"
+    for name, p in _list_dir(audio_dir, ".flac"):
+        if fnmatch.fnmatch(name, pattern):
+            return Path(p)
+    return None
 
 
 def _find_audio(ep_str: str, config: ShowConfig) -> Path:
     """Find the audio file for the given episode string."""
-    # Map "Movie" to "01" for audio search if needed
-    search_str = ep_str
-    if ep_str.lower() == "movie":
-        search_str = "01"
-
-    search = GlobSearch(
-        f"*Audio*{search_str}*.flac",
-        allow_multiple=True,
-        recursive=True,
-        dir=str(config.audio_dir),
-    )
+    # Map "Movie" to "01" for audio search
+    search_str = "01" if ep_str.lower() == "movie" else ep_str
 
-    if not search.paths:
-        # specific fallback for this show/audio naming
-        if ep_str.lower() == "movie":
-            search = GlobSearch(
-                "*Audio*01*.flac",
-                allow_multiple=True,
-                recursive=True,
-                dir=str(config.audio_dir),
-            )
+    audio_file = _lookup_audio(config.audio_dir_s, search_str)
+    if audio_file is None:
+        raise FileNotFoundError(f"Audio file not found for episode {ep_str}")
+    return audio_file
 
-        if not search.paths:
-            raise FileNotFoundError(f"Audio file not found for episode {ep_str}")
 
-    return Path(search.paths[0])
+@lru_cache(maxsize=None)
+def _template_dir() -> str:
+    """Per-process scratch dir for merged subtitle templates."""
+    path = tempfile.mkdtemp(prefix="mux-system-")
+    # Runs at exit in pool workers too, unlike a plain atexit hook
+    Finalize(
+        None,
+        shutil.rmtree,
+        args=(path,),
+        kwargs={"ignore_errors": True},
+        exitpriority=0,
+    )
+    return path
 
 
-def _get_subtitle_file(path: Path, delay: int = 0) -> SubFile:
-    """Prepare a subtitle file."""
-    if not path.exists():
-        raise FileNotFoundError(f"Subtitle file not found at {path}")
+@lru_cache(maxsize=8)
+def _load_sub_template(path_str: str) -> str:
+    """Merge and clean a subtitle file once per process.
 
-    sub = SubFile(str(path), container_delay=delay)
+    ``SubFile`` edits a working copy inside the current Setup's work dir, so
+    the result is copied out to a private template file that no episode
+    touches; each episode then builds its own ``SubFile`` from it.
+    """
+    sub = SubFile(path_str)
     # Apply cleaning
     sub.merge(r"common/warning.ass").clean_styles().clean_garbage()
-    return sub
+    template = os.path.join(_template_dir(), os.path.basename(path_str))
+    shutil.copyfile(sub.file, template)
+    return template
+
+
+@lru_cache(maxsize=None)
+def _sub_index(sub_dir: str) -> dict[str, str]:
+    """Map subtitle file names to paths."""
+    return {e.name: e.path for e in _DIR_CACHE.list(sub_dir) if e.is_file}
+
+
+def _find_subtitle(name: str, config: ShowConfig) -> str:
+    """Find a subtitle file by name without a per-call ``exists()`` check."""
+    try:
+        return _sub_index(config.sub_dir_s)[name]
+    except KeyError:
+        raise FileNotFoundError(
+            f"Subtitle file not found at {os.path.join(config.sub_dir_s, name)}"
+        ) from None
+
+
+def _get_subtitle_file(path: str, delay: int = 0) -> SubFile:
+    """Prepare a subtitle file resolved by ``_find_subtitle``."""
+    return SubFile(_load_sub_template(path), container_delay=delay)
+
+
+@lru_cache(maxsize=None)
+def _load_chapters(path: str) -> Chapters:
+    """Parse the chapters XML once per process."""
+    return Chapters(path)
+
+
+@lru_cache(maxsize=None)
+def _tmdb_config(tmdb_id: int) -> TmdbConfig:
+    """Build the TMDB config once per process."""
+    return TmdbConfig(tmdb_id, write_cover=True, movie=True)
+
+
+# Fonts per (subtitle source, font dir); the subtitle sources are shared by
+# every episode of the show, so the font dirs are scanned once per process.
+_FONT_CACHE: dict[tuple[str, str], list[FontFile]] = {}
+
+
+def _collect_fonts(sub: SubFile, source: str, font_dir: str) -> list[FontFile]:
+    """Collect the fonts used by a subtitle track, reusing earlier results."""
+    key = (source, font_dir)
+    if key not in _FONT_CACHE:
+        _FONT_CACHE[key] = sub.collect_fonts(
+            use_system_fonts=False, additional_fonts=font_dir
+        )
+    return _FONT_CACHE[key]
+
+
+@dataclass(frozen=True, slots=True)
+class _EpisodeInputs:
+    """Input files needed to mux one episode."""
+
+    video: Path
+    audio: Path
+    caramel: str
+    melody: str
+
+
+def _resolve_inputs(ep_str: str, config: ShowConfig) -> _EpisodeInputs:
+    """Resolve every input of an episode; raise FileNotFoundError if one is missing."""
+    return _EpisodeInputs(
+        video=_find_video(ep_str, config),
+        audio=_find_audio(ep_str, config),
+        caramel=_find_subtitle("Caramel.ass", config),
+        melody=_find_subtitle("Melody.ass", config),
+    )
+
+
+@lru_cache(maxsize=None)
+def _naming(flag: str, version: int) -> tuple[str, str]:
+    """Build the ``out_name`` and ``mkv_title_naming`` templates for a run."""
+    version_str = "" if version == 1 else f" v{version}"
+    return (
+        f"[{flag}] $show$ - $ep${version_str} (BDRip 1920x1080 HEVC FLAC) [$crc32$]",
+        f"$show$ - $ep${version_str}",
+    )
 
 
 def mux_episode(
@@ -162,7 +378,7 @@ def mux_episode(
 ) -> MuxResult:
     config = config or CONFIG
     ep_str = _get_episode_str(episode)
-    version_str = "" if version == 1 else f" v{version}"
+    out_name, mkv_title = _naming(flag, version)
 
     # Title handling
     title = ""
@@ -173,58 +389,57 @@ def mux_episode(
     ):
         title = f" | {config.titles[episode - 1]}"
 
-    setup = Setup(
-        ep_str,
-        None,
-        show_name=config.name,
-        out_name=f"[{flag}] $show$ - $ep${version_str} (BDRip 1920x1080 HEVC FLAC) [$crc32$]",
-        mkv_title_naming=f"$show$ - $ep${version_str}{title}",
-        out_dir=str(out_dir),
-        clean_work_dirs=False,
-    )
-
     try:
         # Locating Resources
-        video_file = _find_video(ep_str, config)
-        audio_file = _find_audio(ep_str, config)
-
-        caramel_path = config.sub_dir / "Caramel.ass"
-        melody_path = config.sub_dir / "Melody.ass"
+        inputs = _resolve_inputs(ep_str, config)
 
         log.info("Resources found:")
-        log.info(f"  Video:   {video_file}")
-        log.info(f"  Audio:   {audio_file}")
-        log.info(f"  Sub(Caramel): {caramel_path}")
-        log.info(f"  Sub(Melody):  {melody_path}")
+        log.info(f"  Video:   {inputs.video}")
+        log.info(f"  Audio:   {inputs.audio}")
+        log.info(f"  Sub(Caramel): {inputs.caramel}")
+        log.info(f"  Sub(Melody):  {inputs.melody}")
 
         if mode == RunMode.DRYRUN:
             log.info(f"[Dry Run] Would mux episode {ep_str} to {out_dir}")
             return MuxResult(episode, True)
 
-        setup.set_default_sub_timesource(str(video_file))
+        # Only real runs need a Setup (and its work dir)
+        setup = Setup(
+            ep_str,
+            None,
+            show_name=config.name,
+            out_name=out_name,
+            mkv_title_naming=f"{mkv_title}{title}",
+            out_dir=str(out_dir),
+            clean_work_dirs=False,
+        )
+        setup.set_default_sub_timesource(str(inputs.video))
 
         # Audio
-        audio = AudioFile(str(audio_file))
+        audio = AudioFile(str(inputs.audio))
 
         # Prepare Subtitles
-        caramel_sub = _get_subtitle_file(caramel_path, delay=1000)
-        melody_sub = _get_subtitle_file(melody_path)
+        caramel_sub = _get_subtitle_file(inputs.caramel, delay=1000)
+        melody_sub = _get_subtitle_file(inputs.melody)
 
         # Chapters & Fonts
-        chapters = Chapters(r"./subtitle/chapter.xml")
+        chapters = _load_chapters(r"./subtitle/chapter.xml")
 
-        # Collect fonts from both subtitle tracks
-        fonts_caramel = caramel_sub.collect_fonts(
-            use_system_fonts=False, additional_fonts=r"./subtitle/font-caramel"
-        )
-
-        fonts_melody = melody_sub.collect_fonts(
-            use_system_fonts=False, additional_fonts=r"./subtitle/font-melody"
-        )
+        # Collect fonts from both subtitle tracks. Cache misses (the first
+        # episode per process) scan disjoint font dirs, so run those side by side
+        font_jobs = [
+            (caramel_sub, inputs.caramel, r"./subtitle/font-caramel"),
+            (melody_sub, inputs.melody, r"./subtitle/font-melody"),
+        ]
+        misses = [j for j in font_jobs if (j[1], j[2]) not in _FONT_CACHE]
+        if len(misses) > 1:
+            with ThreadPoolExecutor(max_workers=len(misses)) as tp:
+                list(tp.map(lambda j: _collect_fonts(*j), misses))
+        fonts_caramel, fonts_melody = (_collect_fonts(*j) for j in font_jobs)
 
         # Muxing
         premux = Premux(
-            str(video_file),
+            str(inputs.video),
             audio=None,
             subtitles=None,
             keep_attachments=False,
@@ -245,7 +460,7 @@ def mux_episode(
 
         outfile = mux(
             *mux_args,
-            tmdb=TmdbConfig(config.tmdb_id, write_cover=True, movie=True),
+            tmdb=_tmdb_config(config.tmdb_id),
         )
         log.info(f"Muxed: {outfile.name}")
         return MuxResult(episode, True)
@@ -255,30 +470,66 @@ def mux_episode(
         return MuxResult(episode, False, str(e))
 
 
+def _preflight(episodes: list[str | int], config: ShowConfig) -> list[MuxResult]:
+    """Check every episode's inputs up front; return the failures."""
+    failures = []
+    for episode in episodes:
+        try:
+            _resolve_inputs(_get_episode_str(episode), config)
+        except FileNotFoundError as e:
+            failures.append(MuxResult(episode, False, str(e)))
+    return failures
+
+
+def _worker(
+    episode: str | int,
+    out_dir: Path,
+    version: int,
+    flag: str,
+    mode: RunMode,
+) -> MuxResult:
+    """Mux a single episode inside a worker process."""
+    return mux_episode(episode, out_dir, version=version, flag=flag, mode=mode)
+
+
 def parse_episodes(arg: str) -> list[str | int]:
     """Parse episode argument into a list of episode identifiers."""
     if arg.lower() == "all":
         # Integer episodes
         eps = {
-            int(p.stem[:2])
-            for p in CONFIG.sub_dir.glob("*.ass")
-            if p.stem[:2].isdigit()
+            int(m.group(1))
+            for e in _DIR_CACHE.list(CONFIG.sub_dir_s)
+            if e.is_file and e.name.endswith(".ass") and (m := _EP_RE.match(e.name))
         }
         return sorted(list(eps), key=lambda x: str(x))
 
-    eps = []
+    # Insertion-ordered dict deduplicates while preserving order
+    seen: dict[str | int, None] = {}
     for part in arg.split(","):
         part = part.strip()
-        if "-" in part and part.replace("-", "").isdigit():
-            start, end = map(int, part.split("-"))
-            eps.extend(range(start, end + 1))
-        elif part.isdigit():
-            eps.append(int(part))
+        if not part:
+            continue
+        if m := _EP_SPEC_RE.fullmatch(part):
+            start, end = m.groups()
+            if end is None:
+                seen[int(start)] = None
+            else:
+                for ep in range(int(start), int(end) + 1):
+                    seen[ep] = None
+        elif part.replace("-", "").isdigit():
+            raise ValueError(f"Invalid episode range: {part}")
         else:
-            eps.append(part)
+            seen[part] = None
+
+    return list(seen)
+
 
-    # Deduplicate while preserving order
-    return list(dict.fromkeys(eps))
+def _positive_int(value: str) -> int:
+    """Argparse type for counts that must be at least 1."""
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
 
 
 def main() -> int:
@@ -293,6 +544,18 @@ def main() -> int:
     parser.add_argument("-f", "--flag", default="pololer", help="Release group/flag")
     parser.add_argument("-d", "--dry-run", action="store_true", help="Dry run")
     parser.add_argument("-v", "--version", type=int, default=1, help="Version number")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Parallel mux jobs (default: min(episodes, CPU count))",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop scheduling episodes after the first failure",
+    )
 
     args = parser.parse_args()
 
@@ -306,25 +569,86 @@ def main() -> int:
         log.error("No episodes found")
         return 1
 
+    # Fail fast before muxing anything; dry runs report per episode instead
+    if not args.dry_run:
+        failures = _preflight(episodes, CONFIG)
+        if failures:
+            for r in failures:
+                log.error(f"Preflight failed for {r.episode}: {r.error}")
+            log.error(
+                f"Aborting: {len(failures)}/{len(episodes)} episodes missing inputs."
+            )
+            return 1
+
     out_dir = Path(args.outdir).resolve()
     if not args.dry_run:
         out_dir.mkdir(parents=True, exist_ok=True)
 
-    results = [
-        mux_episode(
-            ep,
-            out_dir,
-            flag=args.flag,
-            mode=RunMode.DRYRUN if args.dry_run else RunMode.NORMAL,
-            version=args.version,
-        )
-        for ep in episodes
-    ]
+    # Dry runs only log lookups, so a worker pool would be pure overhead
+    if args.dry_run:
+        jobs = 1
+    else:
+        jobs = args.jobs or min(len(episodes), os.cpu_count() or 1)
+    worker = partial(
+        _worker,
+        out_dir=out_dir,
+        version=args.version,
+        flag=args.flag,
+        mode=RunMode.DRYRUN if args.dry_run else RunMode.NORMAL,
+    )
+
+    results: list[MuxResult] = []
+
+    def report(r: MuxResult) -> bool:
+        """Record a result as it arrives; return True to stop scheduling."""
+        results.append(r)
+        if r.success:
+            log.info(f"[{r.episode}] OK")
+        else:
+            log.error(f"[{r.episode}] FAIL: {r.error}")
+        return args.fail_fast and not r.success
+
+    # Each episode gets its own work dir (keyed by ep_str), so mkvmerge
+    # instances in separate processes do not collide.
+    ex = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        if ex is None:
+            for ep in episodes:
+                if report(worker(ep)):
+                    break
+        else:
+            # Keep at most `jobs` episodes in flight: anything handed to the
+            # pool is queued to a worker at once and can no longer be cancelled
+            queue = iter(episodes)
+            futures = {ex.submit(worker, ep): ep for ep in islice(queue, jobs)}
+            stop = False
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    ep = futures.pop(fut)
+                    try:
+                        r = fut.result()
+                    except BrokenProcessPool as e:
+                        # A dead worker breaks the whole pool; schedule nothing more
+                        r, stop = MuxResult(ep, False, str(e)), True
+                    stop = report(r) or stop
+                if not stop:
+                    for ep in islice(queue, len(done)):
+                        futures[ex.submit(worker, ep)] = ep
+    except KeyboardInterrupt:
+        # Unlike leaving a `with` block, do not wait for queued episodes
+        if ex is not None:
+            ex.shutdown(wait=False, cancel_futures=True)
+        log.error("Interrupted; remaining episodes were not muxed.")
+        return 130
+
+    if ex is not None:
+        ex.shutdown()
 
     success_count = sum(1 for r in results if r.success)
-    log.info(f"Processed {success_count}/{len(results)} episodes successfully.")
+    log.info(f"Processed {success_count}/{len(episodes)} episodes successfully.")
 
-    return 0 if success_count == len(results) else 1
+    return 0 if success_count == len(episodes) else 1
 
 
 if __name__ == "__main__":